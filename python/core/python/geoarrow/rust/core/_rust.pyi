@@ -16,6 +16,9 @@ class PointArray:
     def __arrow_c_array__(
         self, requested_schema: object | None = None
     ) -> Tuple[object, object]: ...
+    def __array__(
+        self, dtype: object | None = None, copy: bool | None = None
+    ) -> NDArray[np.float64]: ...
     def area(self) -> Float64Array: ...
     def bounding_rect(self) -> RectArray: ...
     def center(self) -> PointArray: ...
@@ -270,6 +273,9 @@ class Float64Array:
     def __arrow_c_array__(
         self, requested_schema: object | None = None
     ) -> Tuple[object, object]: ...
+    def __array__(
+        self, dtype: object | None = None, copy: bool | None = None
+    ) -> NDArray[np.float64]: ...
     def to_numpy(self) -> NDArray[np.float64]: ...
 
 # class Int16Array:
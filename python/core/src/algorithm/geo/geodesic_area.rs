@@ -36,10 +36,11 @@ use pyo3::prelude::*;
 /// Returns:
 ///     Array with output values.
 #[pyfunction]
-pub fn geodesic_area_signed(input: &PyAny) -> PyGeoArrowResult<Float64Array> {
+pub fn geodesic_area_signed(py: Python, input: &PyAny) -> PyGeoArrowResult<Float64Array> {
     let (array, field) = import_arrow_c_array(input)?;
     let array = from_arrow_array(&array, &field)?;
-    Ok(array.as_ref().geodesic_area_signed()?.into())
+    let out = py.allow_threads(|| array.as_ref().geodesic_area_signed())?;
+    Ok(out.into())
 }
 
 /// Determine the area of a geometry on an ellipsoidal model of the earth. Supports very large geometries that cover a significant portion of the earth.
@@ -64,10 +65,11 @@ pub fn geodesic_area_signed(input: &PyAny) -> PyGeoArrowResult<Float64Array> {
 /// Returns:
 ///     Array with output values.
 #[pyfunction]
-pub fn geodesic_area_unsigned(input: &PyAny) -> PyGeoArrowResult<Float64Array> {
+pub fn geodesic_area_unsigned(py: Python, input: &PyAny) -> PyGeoArrowResult<Float64Array> {
     let (array, field) = import_arrow_c_array(input)?;
     let array = from_arrow_array(&array, &field)?;
-    Ok(array.as_ref().geodesic_area_unsigned()?.into())
+    let out = py.allow_threads(|| array.as_ref().geodesic_area_unsigned())?;
+    Ok(out.into())
 }
 
 /// Determine the perimeter of a geometry on an ellipsoidal model of the earth.
@@ -86,10 +88,11 @@ pub fn geodesic_area_unsigned(input: &PyAny) -> PyGeoArrowResult<Float64Array> {
 /// Returns:
 ///     Array with output values.
 #[pyfunction]
-pub fn geodesic_perimeter(input: &PyAny) -> PyGeoArrowResult<Float64Array> {
+pub fn geodesic_perimeter(py: Python, input: &PyAny) -> PyGeoArrowResult<Float64Array> {
     let (array, field) = import_arrow_c_array(input)?;
     let array = from_arrow_array(&array, &field)?;
-    Ok(array.as_ref().geodesic_perimeter()?.into())
+    let out = py.allow_threads(|| array.as_ref().geodesic_perimeter())?;
+    Ok(out.into())
 }
 
 macro_rules! impl_geodesic_area {
@@ -122,8 +125,9 @@ macro_rules! impl_geodesic_area {
             ///
             /// Returns:
             ///     Array with output values.
-            pub fn geodesic_area_signed(&self) -> Float64Array {
-                GeodesicArea::geodesic_area_signed(&self.0).into()
+            pub fn geodesic_area_signed(&self, py: Python) -> Float64Array {
+                py.allow_threads(|| GeodesicArea::geodesic_area_signed(&self.0))
+                    .into()
             }
 
             /// Determine the area of a geometry on an ellipsoidal model of the earth. Supports very large geometries that cover a significant portion of the earth.
@@ -144,8 +148,9 @@ macro_rules! impl_geodesic_area {
             ///
             /// Returns:
             ///     Array with output values.
-            pub fn geodesic_area_unsigned(&self) -> Float64Array {
-                GeodesicArea::geodesic_area_unsigned(&self.0).into()
+            pub fn geodesic_area_unsigned(&self, py: Python) -> Float64Array {
+                py.allow_threads(|| GeodesicArea::geodesic_area_unsigned(&self.0))
+                    .into()
             }
 
             /// Determine the perimeter of a geometry on an ellipsoidal model of the earth.
@@ -163,8 +168,9 @@ macro_rules! impl_geodesic_area {
             ///
             /// Returns:
             ///     Array with output values.
-            pub fn geodesic_perimeter(&self) -> Float64Array {
-                GeodesicArea::geodesic_perimeter(&self.0).into()
+            pub fn geodesic_perimeter(&self, py: Python) -> Float64Array {
+                py.allow_threads(|| GeodesicArea::geodesic_perimeter(&self.0))
+                    .into()
             }
         }
     };
@@ -209,8 +215,12 @@ macro_rules! impl_chunked {
             ///
             /// Returns:
             ///     Array with output values.
-            pub fn geodesic_area_signed(&self) -> PyGeoArrowResult<ChunkedFloat64Array> {
-                Ok(GeodesicArea::geodesic_area_signed(&self.0)?.into())
+            pub fn geodesic_area_signed(
+                &self,
+                py: Python,
+            ) -> PyGeoArrowResult<ChunkedFloat64Array> {
+                let out = py.allow_threads(|| GeodesicArea::geodesic_area_signed(&self.0))?;
+                Ok(out.into())
             }
 
             /// Determine the area of a geometry on an ellipsoidal model of the earth. Supports very large geometries that cover a significant portion of the earth.
@@ -231,8 +241,12 @@ macro_rules! impl_chunked {
             ///
             /// Returns:
             ///     Array with output values.
-            pub fn geodesic_area_unsigned(&self) -> PyGeoArrowResult<ChunkedFloat64Array> {
-                Ok(GeodesicArea::geodesic_area_unsigned(&self.0)?.into())
+            pub fn geodesic_area_unsigned(
+                &self,
+                py: Python,
+            ) -> PyGeoArrowResult<ChunkedFloat64Array> {
+                let out = py.allow_threads(|| GeodesicArea::geodesic_area_unsigned(&self.0))?;
+                Ok(out.into())
             }
 
             /// Determine the perimeter of a geometry on an ellipsoidal model of the earth.
@@ -250,8 +264,9 @@ macro_rules! impl_chunked {
             ///
             /// Returns:
             ///     Array with output values.
-            pub fn geodesic_perimeter(&self) -> PyGeoArrowResult<ChunkedFloat64Array> {
-                Ok(GeodesicArea::geodesic_perimeter(&self.0)?.into())
+            pub fn geodesic_perimeter(&self, py: Python) -> PyGeoArrowResult<ChunkedFloat64Array> {
+                let out = py.allow_threads(|| GeodesicArea::geodesic_perimeter(&self.0))?;
+                Ok(out.into())
             }
         }
     };
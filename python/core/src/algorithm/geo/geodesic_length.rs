@@ -12,9 +12,10 @@ macro_rules! impl_geodesic_length {
             /// converges.
             ///
             /// [Karney (2013)]:  https://arxiv.org/pdf/1109.4448.pdf
-            pub fn geodesic_length(&self) -> Float64Array {
+            pub fn geodesic_length(&self, py: Python) -> Float64Array {
                 use geoarrow::algorithm::geo::GeodesicLength;
-                GeodesicLength::geodesic_length(&self.0).into()
+                py.allow_threads(|| GeodesicLength::geodesic_length(&self.0))
+                    .into()
             }
         }
     };
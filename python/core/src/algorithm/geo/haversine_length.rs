@@ -11,9 +11,10 @@ macro_rules! impl_haversine_length {
             ///
             /// *Note*: this implementation uses a mean earth radius of 6371.088 km, based on the
             /// [recommendation of the IUGG](ftp://athena.fsv.cvut.cz/ZFG/grs80-Moritz.pdf)
-            pub fn haversine_length(&self) -> Float64Array {
+            pub fn haversine_length(&self, py: Python) -> Float64Array {
                 use geoarrow::algorithm::geo::HaversineLength;
-                HaversineLength::haversine_length(&self.0).into()
+                py.allow_threads(|| HaversineLength::haversine_length(&self.0))
+                    .into()
             }
         }
     };
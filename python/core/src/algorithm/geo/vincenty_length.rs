@@ -9,9 +9,10 @@ macro_rules! impl_vincenty_length {
             /// Determine the length of a geometry using [Vincenty’s formulae].
             ///
             /// [Vincenty’s formulae]: https://en.wikipedia.org/wiki/Vincenty%27s_formulae
-            pub fn vincenty_length(&self) -> PyGeoArrowResult<Float64Array> {
+            pub fn vincenty_length(&self, py: Python) -> PyGeoArrowResult<Float64Array> {
                 use geoarrow::algorithm::geo::VincentyLength;
-                Ok(VincentyLength::vincenty_length(&self.0)?.into())
+                let out = py.allow_threads(|| VincentyLength::vincenty_length(&self.0))?;
+                Ok(out.into())
             }
         }
     };
@@ -1,12 +1,20 @@
 pub mod primitive;
 
 use crate::error::PyGeoArrowResult;
+use arrow_array::cast::AsArray;
+use arrow_array::types::Float64Type;
+use geoarrow::array::CoordBuffer;
+use geoarrow::GeometryArrayTrait;
+use ndarray::{aview1, Array2, ArrayView2};
+use numpy::{IntoPyArray, PyArray2};
+use primitive::{apply_dtype_and_copy, check_no_nulls, copy_required_error};
 pub use primitive::{
     BooleanArray, Float16Array, Float32Array, Float64Array, Int16Array, Int32Array, Int64Array,
     Int8Array, LargeStringArray, StringArray, UInt16Array, UInt32Array, UInt64Array, UInt8Array,
 };
 
 use pyo3::prelude::*;
+use pyo3::types::IntoPyDict;
 
 macro_rules! impl_array {
     (
@@ -73,6 +81,59 @@ impl_array! {
     pub struct RectArray(pub(crate) geoarrow::array::RectArray);
 }
 
+#[pymethods]
+impl PointArray {
+    /// An implementation of the Array interface, for interoperability with numpy and other array
+    /// libraries.
+    ///
+    /// This returns an array of shape `(n, 2)` holding each point's x and y coordinates. For
+    /// interleaved coordinates, unless `copy=True` is passed or `dtype` requires a cast, this is a
+    /// read-only view onto the underlying Arrow buffer without copying. Separated coordinates
+    /// are always copied, so `copy=False` raises a `ValueError` for them.
+    #[pyo3(signature = (dtype=None, copy=None))]
+    pub fn __array__(
+        slf: &PyCell<Self>,
+        dtype: Option<&PyAny>,
+        copy: Option<bool>,
+    ) -> PyResult<PyObject> {
+        let py = slf.py();
+        let this = slf.borrow();
+        check_no_nulls(this.0.null_count())?;
+
+        let (coords, _validity) = this.0.clone().into_inner();
+        match coords {
+            CoordBuffer::Interleaved(coords) => {
+                let values = coords.values_array();
+                let view =
+                    ArrayView2::from_shape((this.0.len(), 2), values.values().as_ref()).unwrap();
+
+                // Safety: `values` shares its buffer with the coordinates held by `slf`, which is
+                // set as the numpy array's base object, so the buffer outlives the view. The view
+                // is marked read-only below because Arrow buffers are immutable and may be
+                // shared.
+                let array = unsafe { PyArray2::borrow_from_array(&view, slf) };
+                array.call_method("setflags", (), Some([("write", false)].into_py_dict(py)))?;
+                apply_dtype_and_copy(array, dtype, copy)
+            }
+            CoordBuffer::Separated(coords) => {
+                if copy == Some(false) {
+                    return Err(copy_required_error());
+                }
+
+                let values = coords.values_array();
+                let mut array = Array2::<f64>::zeros((this.0.len(), 2));
+                for (mut column, values) in array.columns_mut().into_iter().zip(values.iter()) {
+                    column.assign(&aview1(
+                        values.as_primitive::<Float64Type>().values().as_ref(),
+                    ));
+                }
+                // The array is already an owned copy, so only a dtype cast may copy again.
+                apply_dtype_and_copy(array.into_pyarray(py), dtype, None)
+            }
+        }
+    }
+}
+
 #[pymethods]
 impl WKBArray {
     fn to_point_array(&self) -> PyGeoArrowResult<PointArray> {
@@ -1,8 +1,9 @@
 use arrow_array::Array;
 use ndarray::prelude::*;
-use numpy::ToPyArray;
+use numpy::{PyArray1, ToPyArray};
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
+use pyo3::types::IntoPyDict;
 
 macro_rules! impl_primitive_array {
     ($struct_name:ident, $arrow_rs_array:ty) => {
@@ -38,25 +39,79 @@ impl_primitive_array!(Int64Array, arrow::array::Int64Array);
 impl_primitive_array!(StringArray, arrow::array::StringArray);
 impl_primitive_array!(LargeStringArray, arrow::array::LargeStringArray);
 
+/// Raise a `ValueError` if the array has nulls, which numpy arrays can't represent.
+pub(crate) fn check_no_nulls(null_count: usize) -> PyResult<()> {
+    if null_count > 0 {
+        return Err(PyValueError::new_err(
+            "Cannot create numpy array from array with nulls.",
+        ));
+    }
+    Ok(())
+}
+
+/// The error numpy expects from `__array__(copy=False)` when a copy can't be avoided.
+pub(crate) fn copy_required_error() -> PyErr {
+    PyValueError::new_err("Unable to avoid copy while creating a numpy array as requested.")
+}
+
+/// Apply the `dtype` and `copy` arguments of numpy's `__array__` protocol to `array`.
+///
+/// This copies only when `copy=True` or when `dtype` differs from the array's dtype, and raises
+/// a `ValueError` if a copy is needed but `copy=False` was passed.
+pub(crate) fn apply_dtype_and_copy(
+    array: &PyAny,
+    dtype: Option<&PyAny>,
+    copy: Option<bool>,
+) -> PyResult<PyObject> {
+    if let Some(dtype) = dtype {
+        if !array.getattr("dtype")?.eq(dtype)? {
+            if copy == Some(false) {
+                return Err(copy_required_error());
+            }
+            return Ok(array.call_method1("astype", (dtype,))?.into());
+        }
+    }
+
+    if copy == Some(true) {
+        return Ok(array.call_method0("copy")?.into());
+    }
+    Ok(array.into())
+}
+
 macro_rules! impl_to_numpy {
     ($struct_name:ty) => {
         #[pymethods]
         impl $struct_name {
             /// An implementation of the Array interface, for interoperability with numpy and other
             /// array libraries.
-            pub fn __array__(&self) -> PyResult<PyObject> {
-                if self.0.null_count() > 0 {
-                    return Err(PyValueError::new_err(
-                        "Cannot create numpy array from pyarrow array with nulls.",
-                    ));
-                }
-                let array = aview1(self.0.values().as_ref());
-                Ok(Python::with_gil(|py| array.to_pyarray(py).into()))
+            ///
+            /// Unless `copy=True` is passed or `dtype` requires a cast, this returns a read-only
+            /// view onto the underlying Arrow buffer without copying. Use `copy=True` or
+            /// `to_numpy()` to get a writable array.
+            #[pyo3(signature = (dtype=None, copy=None))]
+            pub fn __array__(
+                slf: &PyCell<Self>,
+                dtype: Option<&PyAny>,
+                copy: Option<bool>,
+            ) -> PyResult<PyObject> {
+                let py = slf.py();
+                let this = slf.borrow();
+                check_no_nulls(this.0.null_count())?;
+
+                // Safety: `slf` owns the Arrow buffer and is set as the numpy array's base
+                // object, so the buffer outlives the view. The view is marked read-only below
+                // because Arrow buffers are immutable and may be shared.
+                let view = aview1(this.0.values().as_ref());
+                let array = unsafe { PyArray1::borrow_from_array(&view, slf) };
+                array.call_method("setflags", (), Some([("write", false)].into_py_dict(py)))?;
+                apply_dtype_and_copy(array, dtype, copy)
             }
 
             /// Copy this array to a `numpy` NDArray
             pub fn to_numpy(&self) -> PyResult<PyObject> {
-                self.__array__()
+                check_no_nulls(self.0.null_count())?;
+                let array = aview1(self.0.values().as_ref());
+                Ok(Python::with_gil(|py| array.to_pyarray(py).into()))
             }
         }
     };
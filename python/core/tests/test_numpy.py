@@ -0,0 +1,144 @@
+import gc
+
+import numpy as np
+import pyarrow as pa
+import pytest
+from geoarrow.rust.core import PointArray, area, from_wkt
+
+XY = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0]
+
+
+def interleaved_points(xy=XY) -> PointArray:
+    return PointArray.from_arrow(pa.FixedSizeListArray.from_arrays(pa.array(xy), 2))
+
+
+def separated_points(xy=XY) -> PointArray:
+    struct = pa.StructArray.from_arrays(
+        [pa.array(xy[0::2]), pa.array(xy[1::2])], names=["x", "y"]
+    )
+    return PointArray.from_arrow(struct)
+
+
+def points_with_null() -> pa.FixedSizeListArray:
+    return pa.array([[1.0, 2.0], None, [5.0, 6.0]], type=pa.list_(pa.float64(), 2))
+
+
+def polygon_areas():
+    polygons = from_wkt(
+        pa.array(
+            [
+                "POLYGON ((0 0, 2 0, 2 2, 0 2, 0 0))",
+                "POLYGON ((0 0, 3 0, 3 1, 0 1, 0 0))",
+                "POLYGON ((0 0, 0.5 0, 0.5 0.5, 0 0.5, 0 0))",
+            ]
+        )
+    )
+    return area(polygons)
+
+
+EXPECTED_AREAS = np.array([4.0, 3.0, 0.25])
+
+
+def test_float64_array_view():
+    areas = polygon_areas()
+    arr = np.asarray(areas)
+    np.testing.assert_array_equal(arr, EXPECTED_AREAS)
+    assert arr.dtype == np.float64
+    assert arr.base is areas
+    assert not arr.flags.writeable
+    with pytest.raises(ValueError):
+        arr *= 2
+
+
+def test_float64_array_view_keeps_buffer_alive():
+    arr = np.asarray(polygon_areas())
+    gc.collect()
+    np.testing.assert_array_equal(arr, EXPECTED_AREAS)
+
+
+def test_float64_array_copy():
+    areas = polygon_areas()
+    arr = np.array(areas, copy=True)
+    assert arr.flags.writeable
+    assert arr.base is not areas
+    arr *= 2
+    np.testing.assert_array_equal(areas.to_numpy(), EXPECTED_AREAS)
+    assert areas.to_numpy().flags.writeable
+
+
+def test_float64_array_dtype():
+    areas = polygon_areas()
+    arr = areas.__array__(dtype=np.float32)
+    assert arr.dtype == np.float32
+    np.testing.assert_array_equal(arr, EXPECTED_AREAS.astype(np.float32))
+
+    same = areas.__array__(dtype=np.float64, copy=False)
+    assert same.base is areas
+
+    with pytest.raises(ValueError):
+        areas.__array__(dtype=np.float32, copy=False)
+
+
+def test_float64_array_nulls():
+    areas = PointArray.from_arrow(points_with_null()).area()
+    with pytest.raises(ValueError):
+        np.asarray(areas)
+    with pytest.raises(ValueError):
+        areas.to_numpy()
+
+
+def test_point_array_interleaved_view():
+    points = interleaved_points()
+    arr = np.asarray(points)
+    np.testing.assert_array_equal(arr, np.array(XY).reshape(-1, 2))
+    assert arr.base is points
+    assert not arr.flags.writeable
+    assert points.__array__(copy=False).base is points
+
+
+def test_point_array_view_keeps_buffer_alive():
+    arr = np.asarray(interleaved_points())
+    gc.collect()
+    np.testing.assert_array_equal(arr, np.array(XY).reshape(-1, 2))
+
+
+def test_point_array_sliced():
+    coords = pa.FixedSizeListArray.from_arrays(pa.array(XY), 2)
+    arr = np.asarray(PointArray.from_arrow(coords.slice(1, 2)))
+    np.testing.assert_array_equal(arr, np.array(XY).reshape(-1, 2)[1:3])
+
+    struct = pa.StructArray.from_arrays(
+        [pa.array(XY[0::2]), pa.array(XY[1::2])], names=["x", "y"]
+    )
+    arr = np.asarray(PointArray.from_arrow(struct.slice(1, 2)))
+    np.testing.assert_array_equal(arr, np.array(XY).reshape(-1, 2)[1:3])
+
+
+def test_point_array_separated():
+    points = separated_points()
+    arr = np.asarray(points)
+    np.testing.assert_array_equal(arr, np.array(XY).reshape(-1, 2))
+    assert arr.flags.writeable
+    assert arr.base is not points
+
+    with pytest.raises(ValueError):
+        points.__array__(copy=False)
+
+
+def test_point_array_copy_and_dtype():
+    points = interleaved_points()
+    arr = np.array(points, copy=True)
+    assert arr.flags.writeable
+    assert arr.base is not points
+
+    arr = points.__array__(dtype=np.float32)
+    assert arr.dtype == np.float32
+    np.testing.assert_array_equal(arr, np.array(XY, dtype=np.float32).reshape(-1, 2))
+
+    with pytest.raises(ValueError):
+        points.__array__(dtype=np.float32, copy=False)
+
+
+def test_point_array_nulls():
+    with pytest.raises(ValueError):
+        np.asarray(PointArray.from_arrow(points_with_null()))
@@ -193,7 +193,11 @@ impl<G: GeometryArrayTrait> Area for ChunkedGeometryArray<G> {
 #[cfg(test)]
 mod test {
     use super::*;
+    use crate::test::multipolygon::mp_array;
     use crate::test::polygon::p_array;
+    use crate::trait_::GeometryArraySelfMethods;
+    use arrow_buffer::OffsetBuffer;
+    use geo::polygon;
 
     #[test]
     fn area() {
@@ -201,4 +205,154 @@ mod test {
         let area = arr.unsigned_area();
         assert_eq!(area, Float64Array::new(vec![28., 18.].into(), None));
     }
+
+    #[test]
+    fn area_matches_geo() {
+        let arr = mp_array();
+        let expected: Vec<f64> = arr.iter_geo_values().map(|g| g.signed_area()).collect();
+        assert_eq!(arr.signed_area(), Float64Array::from(expected.clone()));
+
+        let arr = arr.into_coord_type(CoordType::Separated);
+        assert_eq!(arr.signed_area(), Float64Array::from(expected));
+    }
+
+    fn assert_area_eq(actual: &Float64Array, expected: &[Option<f64>]) {
+        assert_eq!(actual, &Float64Array::from(expected.to_vec()));
+    }
+
+    /// Polygons with non-integer coordinates whose rings have 5 to 9 segments.
+    fn float_polygons() -> Vec<geo::Polygon> {
+        vec![
+            // 5 segment exterior, 6 segment interior
+            polygon!(
+                exterior: [
+                    (x: 0.1, y: 0.3),
+                    (x: 10.7, y: -0.2),
+                    (x: 12.3, y: 6.6),
+                    (x: 5.5, y: 11.9),
+                    (x: -1.3, y: 7.1),
+                    (x: 0.1, y: 0.3),
+                ],
+                interiors: [[
+                    (x: 3.3, y: 3.1),
+                    (x: 4.9, y: 2.7),
+                    (x: 6.1, y: 3.9),
+                    (x: 6.2, y: 5.3),
+                    (x: 4.8, y: 6.4),
+                    (x: 3.1, y: 5.2),
+                    (x: 3.3, y: 3.1),
+                ]],
+            ),
+            // 9 segment clockwise exterior
+            polygon![
+                (x: -71.06, y: 42.36),
+                (x: -71.02, y: 42.41),
+                (x: -70.97, y: 42.43),
+                (x: -70.91, y: 42.40),
+                (x: -70.88, y: 42.35),
+                (x: -70.90, y: 42.29),
+                (x: -70.95, y: 42.26),
+                (x: -71.01, y: 42.27),
+                (x: -71.05, y: 42.31),
+                (x: -71.06, y: 42.36),
+            ],
+            // 8 segment exterior
+            polygon![
+                (x: 1.5, y: 0.25),
+                (x: 3.75, y: 0.5),
+                (x: 4.125, y: 2.0),
+                (x: 3.5, y: 3.875),
+                (x: 2.25, y: 4.5),
+                (x: 0.625, y: 3.75),
+                (x: 0.0, y: 2.5),
+                (x: 0.375, y: 1.125),
+                (x: 1.5, y: 0.25),
+            ],
+        ]
+    }
+
+    #[test]
+    fn polygon_area_float_coords() {
+        let polygons = float_polygons();
+        let input = vec![
+            Some(polygons[0].clone()),
+            None,
+            Some(polygons[1].clone()),
+            Some(polygons[2].clone()),
+        ];
+        let signed: Vec<_> = input
+            .iter()
+            .map(|g| g.as_ref().map(|g| g.signed_area()))
+            .collect();
+        let unsigned: Vec<_> = input
+            .iter()
+            .map(|g| g.as_ref().map(|g| g.unsigned_area()))
+            .collect();
+
+        let arr: PolygonArray<i32> = input.into();
+        assert_area_eq(&arr.signed_area(), &signed);
+        assert_area_eq(&arr.unsigned_area(), &unsigned);
+
+        let arr = arr.into_coord_type(CoordType::Separated);
+        assert_area_eq(&arr.signed_area(), &signed);
+        assert_area_eq(&arr.unsigned_area(), &unsigned);
+    }
+
+    #[test]
+    fn multi_polygon_area_float_coords() {
+        let polygons = float_polygons();
+        let input = vec![
+            Some(geo::MultiPolygon(vec![
+                polygons[0].clone(),
+                polygons[1].clone(),
+            ])),
+            None,
+            Some(geo::MultiPolygon(vec![polygons[2].clone()])),
+        ];
+        let signed: Vec<_> = input
+            .iter()
+            .map(|g| g.as_ref().map(|g| g.signed_area()))
+            .collect();
+        let unsigned: Vec<_> = input
+            .iter()
+            .map(|g| g.as_ref().map(|g| g.unsigned_area()))
+            .collect();
+
+        let arr: MultiPolygonArray<i32> = input.into();
+        assert_area_eq(&arr.signed_area(), &signed);
+        assert_area_eq(&arr.unsigned_area(), &unsigned);
+
+        let arr = arr.into_coord_type(CoordType::Separated);
+        assert_area_eq(&arr.signed_area(), &signed);
+        assert_area_eq(&arr.unsigned_area(), &unsigned);
+    }
+
+    #[test]
+    fn unclosed_ring_area() {
+        // Seven vertices without repeating the first one: six stored segments plus the implicit
+        // closing segment.
+        let xy = [
+            (0.5, 0.5),
+            (4.25, 0.75),
+            (6.5, 2.5),
+            (6.0, 5.25),
+            (3.5, 6.75),
+            (0.75, 5.5),
+            (-0.5, 2.75),
+        ];
+        let expected = geo::Polygon::new(geo::LineString::from(xy.to_vec()), vec![]).signed_area();
+
+        let interleaved: Vec<f64> = xy.iter().flat_map(|&(x, y)| [x, y]).collect();
+        let coords = CoordBuffer::Interleaved(InterleavedCoordBuffer::new(interleaved.into()));
+        let arr = PolygonArray::<i32>::new(
+            coords,
+            OffsetBuffer::new(vec![0, 1].into()),
+            OffsetBuffer::new(vec![0, xy.len() as i32].into()),
+            None,
+        );
+        assert_area_eq(&arr.signed_area(), &[Some(expected)]);
+
+        let arr = arr.into_coord_type(CoordType::Separated);
+        assert_area_eq(&arr.signed_area(), &[Some(expected)]);
+    }
 }